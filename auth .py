@@ -27,7 +27,7 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 from driver import create_chrome_driver, close_driver
 from config.settings import AMAZON_BASE_URL, LOG_FORMAT, LOG_DATE_FORMAT
@@ -58,6 +58,13 @@ LOGGED_IN_TEXT_PATTERNS = [
     "Sign Out",     # Sign out option visible
 ]
 
+# Returns [account greeting text or null, sign-out link present]
+_LOGIN_STATE_JS = """
+var greeting = document.getElementById("nav-link-accountList-nav-line-1");
+return [greeting ? greeting.innerText : null,
+        !!document.getElementById("nav-item-signout")];
+"""
+
 
 def check_if_logged_in(driver) -> bool:
     """
@@ -70,39 +77,25 @@ def check_if_logged_in(driver) -> bool:
         bool: True if logged in, False otherwise
     """
     try:
-        # Check for account greeting (Hello, Name)
-        try:
-            account_element = driver.find_element(
-                By.CSS_SELECTOR, 
-                "#nav-link-accountList-nav-line-1"
-            )
-            greeting_text = account_element.text.strip()
-            
-            # If it says "Hello, Sign in" then NOT logged in
-            # If it says "Hello, [Name]" then logged in
-            if greeting_text and "Sign in" not in greeting_text and "Hello" in greeting_text:
-                logger.info(f"Detected logged in user: {greeting_text}")
-                return True
-        except:
-            pass
-        
-        # Check URL - if we're on a signin page, not logged in
+        # Check URL first - if we're on a signin page, not logged in
+        # (no DOM access needed)
         current_url = driver.current_url.lower()
         if "/ap/signin" in current_url or "/ap/cvf" in current_url:
             return False
         
-        # Check for sign out link (only visible when logged in)
-        try:
-            # Hover over account menu to reveal sign out
-            account_list = driver.find_element(By.ID, "nav-link-accountList")
-            if account_list:
-                # Check page source for sign out
-                if "nav-item-signout" in driver.page_source:
-                    return True
-        except:
-            pass
+        # Greeting text and sign-out link in one round-trip, instead of
+        # a find_element plus a full page_source transfer
+        greeting_text, has_signout = driver.execute_script(_LOGIN_STATE_JS)
+        greeting_text = (greeting_text or "").strip()
         
-        return False
+        # If it says "Hello, Sign in" then NOT logged in
+        # If it says "Hello, [Name]" then logged in
+        if greeting_text and "Sign in" not in greeting_text and "Hello" in greeting_text:
+            logger.info(f"Detected logged in user: {greeting_text}")
+            return True
+        
+        # Sign out link (only present when logged in)
+        return bool(has_signout)
         
     except Exception as e:
         logger.debug(f"Error checking login status: {e}")
@@ -113,7 +106,7 @@ def wait_for_manual_login(driver, timeout_minutes: int = 10) -> bool:
     """
     Wait for user to complete manual login.
     
-    Polls every few seconds to check if login was successful.
+    Lets WebDriverWait poll for a logged-in-only element.
     
     Args:
         driver: WebDriver instance
@@ -136,35 +129,42 @@ def wait_for_manual_login(driver, timeout_minutes: int = 10) -> bool:
     
     start_time = time.time()
     timeout_seconds = timeout_minutes * 60
-    check_interval = 3  # Check every 3 seconds
+    last_progress = [start_time]
     
-    while (time.time() - start_time) < timeout_seconds:
-        # Check if logged in
-        if check_if_logged_in(driver):
-            logger.info("Login successful! Session will be saved.")
-            return True
-        
-        # Check if still on login page or moved away
-        current_url = driver.current_url.lower()
-        
-        # If redirected to homepage and logged in
-        if "amazon.in" in current_url and "/ap/" not in current_url:
-            # Double check login status
-            time.sleep(2)  # Wait for page to fully load
-            if check_if_logged_in(driver):
-                logger.info("Login successful! Session will be saved.")
-                return True
-        
-        time.sleep(check_interval)
-        
+    def login_marker_present(driver):
+        """Wait condition: an element that only exists when logged in."""
         # Progress indicator every 30 seconds
-        elapsed = int(time.time() - start_time)
-        if elapsed % 30 == 0 and elapsed > 0:
-            remaining = timeout_seconds - elapsed
+        now = time.time()
+        if now - last_progress[0] >= 30:
+            last_progress[0] = now
+            remaining = int(timeout_seconds - (now - start_time))
             logger.info(f"Still waiting for login... ({remaining}s remaining)")
+        
+        # Sign out link (only rendered for a logged in user)
+        if driver.find_elements(By.ID, "nav-item-signout"):
+            return True
+        
+        # "Hello, Name" greeting (but not "Hello, Sign in")
+        greeting = driver.find_elements(By.ID, "nav-link-accountList-nav-line-1")
+        if greeting:
+            greeting_text = greeting[0].text.strip()
+            return "Hello" in greeting_text and "Sign in" not in greeting_text
+        return False
+    
+    # Selenium polls the condition and returns on the first hit
+    try:
+        WebDriverWait(
+            driver,
+            timeout_seconds,
+            poll_frequency=2,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(login_marker_present)
+    except TimeoutException:
+        logger.warning("Login timeout - did not detect successful login")
+        return False
     
-    logger.warning("Login timeout - did not detect successful login")
-    return False
+    logger.info("Login successful! Session will be saved.")
+    return True
 
 
 def verify_session_saved(driver) -> bool:
@@ -5,15 +5,36 @@ The html_scraper.py saves multiple pages (product + reviews) into one file
 separated by metadata headers. This module handles that splitting.
 """
 
+import mmap
 import re
+import zlib
 from pathlib import Path
-from bs4 import BeautifulSoup
+
+import lxml.html
+from lxml import etree
 
 # pattern that separates each page section in the combined HTML file
+# (\r?\n: files are read without newline translation, and older dumps,
+# written in text mode before the scraper switched to binary, have \r\n
+# line endings on Windows)
 PAGE_HEADER = re.compile(
-    r"={80}\nPAGE:\s*(.+?)\nURL:\s*(.+?)\nTIMESTAMP:\s*(.+?)\nSIZE:\s*(.+?)\n={80}"
+    r"={80}\r?\nPAGE:\s*(.+?)\r?\nURL:\s*(.+?)\r?\nTIMESTAMP:\s*(.+?)\r?\n"
+    r"SIZE:\s*(.+?)\r?\n={80}"
+)
+PAGE_HEADER_BYTES = re.compile(PAGE_HEADER.pattern.encode())
+
+# files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 8 << 20
+
+# one parser shared by every page; ids are never looked up through the
+# parser's id table, and blank text nodes are dropped by text_of anyway
+_PARSER = lxml.html.HTMLParser(
+    collect_ids=False, remove_blank_text=True, huge_tree=True
 )
 
+# every text node under an element, minus script/style bodies
+_XP_TEXT = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
 
 def load_html(filepath):
     """Read the raw HTML file content."""
@@ -21,47 +42,152 @@ def load_html(filepath):
     if not path.exists():
         raise FileNotFoundError(f"HTML file not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    raw = _read_gzip(path) if path.suffix == ".gz" else path.read_bytes()
+
+    # one-shot decode; skips the text layer's newline translation
+    return raw.decode("utf-8", errors="replace")
+
+
+def parse_html(html):
+    """Parse an HTML string into an lxml tree (the <html> root element)."""
+    if not html.strip():
+        html = "<html></html>"
+    try:
+        return lxml.html.document_fromstring(html, parser=_PARSER)
+    except etree.ParserError:
+        # nothing but comments (e.g. a blocked run's dump); BeautifulSoup
+        # gave an empty tree here too
+        return lxml.html.document_fromstring("<html></html>", parser=_PARSER)
+
+
+def text_of(element):
+    """
+    Visible text of *element*, each piece stripped and joined.
+
+    Same result as BeautifulSoup's get_text(strip=True).
+    """
+    return "".join(s.strip() for s in _XP_TEXT(element))
+
+
+def has_class(name):
+    """XPath predicate: the class attribute contains the token *name*."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def iter_sections(raw_content):
+    """
+    Split a combined HTML file into raw page sections (no parsing).
+
+    Yields dicts: {label, url, timestamp, html}, one per page.
+    Only two header matches are held at a time.
+    """
+    yield from _iter_sections(raw_content, PAGE_HEADER)
+
+
+def iter_file_sections(filepath):
+    """
+    Same as iter_sections(load_html(filepath)), but large files are
+    memory-mapped and scanned in place; each section is decoded only
+    when it is yielded.
+    """
+    yield from scan_file_sections(filepath)[1]
+
+
+def scan_file_sections(filepath):
+    """
+    Header-only scan of a dump, plus a lazy walk over its sections.
+
+    Returns (labels, sections): the page labels in file order, found
+    without decoding any page, and an iterator yielding the same dicts
+    as iter_file_sections. Lets callers count pages and find the product
+    page before the sections are streamed.
+    """
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"HTML file not found: {path}")
+
+    # gzipped dumps can't be mapped; they are decompressed in one go
+    if path.suffix == ".gz" or path.stat().st_size <= MMAP_THRESHOLD:
+        content = load_html(path)
+        return _section_labels(content, PAGE_HEADER), iter_sections(content)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        labels = _section_labels(mm, PAGE_HEADER_BYTES)
+    return labels, _iter_mapped_sections(path)
 
 
 def split_pages(raw_content):
     """
-    Split a combined HTML file into individual page sections.
+    Split a combined HTML file into individual parsed pages.
+
+    Yields dicts: {label, url, timestamp, tree}, one per page.
+    Each 'tree' is a ready-to-query lxml element, parsed only when its
+    page is reached.
+    """
+    for section in iter_sections(raw_content):
+        html = section.pop("html")
+        section["tree"] = parse_html(html)
+        yield section
+
+
+def _read_gzip(path):
+    """
+    Helper - decompress a .gz dump.
 
-    Returns list of dicts: [{label, url, timestamp, soup}, ...]
-    Each 'soup' is a ready-to-use BeautifulSoup object.
+    A dump whose scraper was killed before closing it has no gzip trailer;
+    decompressobj still returns everything written up to that point.
     """
-    pages = []
-    separators = list(PAGE_HEADER.finditer(raw_content))
+    return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(path.read_bytes())
+
+
+def _iter_mapped_sections(path):
+    """Helper - section walk over a memory-mapped file, kept open while in use."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from _iter_sections(mm, PAGE_HEADER_BYTES)
+
+
+def _section_labels(content, pattern):
+    """Helper - page labels from the headers alone; matches _iter_sections."""
+    labels = [_as_text(m.group(1).strip()) for m in pattern.finditer(content)]
+    return labels or ["full_file"]
+
+
+def _iter_sections(content, pattern):
+    """Helper - section walk shared by str content and mmapped bytes."""
+    prev = None
+    for match in pattern.finditer(content):
+        if prev is not None:
+            yield _build_section(content, prev, match.start())
+        prev = match
 
     # no separators → treat the whole file as one page
-    if not separators:
-        soup = BeautifulSoup(raw_content, "lxml")
-        pages.append({
+    if prev is None:
+        yield {
             "label": "full_file",
             "url": "",
             "timestamp": "",
-            "soup": soup,
-        })
-        return pages
-
-    for i, match in enumerate(separators):
-        label = match.group(1).strip()
-        url = match.group(2).strip()
-        timestamp = match.group(3).strip()
-
-        # grab the html between this header and the next one
-        start = match.end()
-        end = separators[i + 1].start() if i + 1 < len(separators) else len(raw_content)
-        html = raw_content[start:end].strip()
-
-        soup = BeautifulSoup(html, "lxml")
-        pages.append({
-            "label": label,
-            "url": url,
-            "timestamp": timestamp,
-            "soup": soup,
-        })
-
-    return pages
+            "html": _as_text(content[:]),
+        }
+        return
+
+    yield _build_section(content, prev, len(content))
+
+
+def _build_section(content, match, end):
+    """Helper - build one section dict from its header match and end offset."""
+    # grab the html between this header and the next one
+    html = content[match.end():end].strip()
+
+    return {
+        "label": _as_text(match.group(1).strip()),
+        "url": _as_text(match.group(2).strip()),
+        "timestamp": _as_text(match.group(3).strip()),
+        "html": _as_text(html),
+    }
+
+
+def _as_text(value):
+    """Helper - decode mmapped bytes; str passes through untouched."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
@@ -1,59 +1,72 @@
 """
 Product-level extractors - title, price, about-this-item bullets.
 
-Each function takes a BeautifulSoup object and returns the extracted value.
+Each function takes a parsed lxml tree and returns the extracted value.
 """
 
-import re
+from lxml import etree
 
+from extract.loader import has_class, text_of
 
-def get_product_title(soup):
+_XP_TITLE = etree.XPath('//span[@id="productTitle"]')
+_XP_PRICE = etree.XPath(f"//span[{has_class('a-price-whole')}]")
+# approach 1 in one evaluation: the first <h3> mentioning "about this item"
+# (case-insensitive) and the first a-unordered-list after it
+_XP_ABOUT_UL = etree.XPath(
+    '(//h3[contains(translate(normalize-space(.), "ABOUTHISEM", "abouthisem"),'
+    ' "about this item")])[1]'
+    '/following::ul[contains(@class, "a-unordered-list")][1]'
+)
+_XP_BULLETS_UL = etree.XPath('//div[@id="feature-bullets"]//ul')
+_XP_EXACT_UL = etree.XPath('//ul[@class="a-unordered-list a-vertical a-spacing-small"]')
+_XP_LI = etree.XPath(".//li")
+_XP_LIST_ITEM = etree.XPath(f".//span[{has_class('a-list-item')}]")
+
+
+def get_product_title(tree):
     """Pull the product title from <span id="productTitle">."""
-    tag = soup.find("span", id="productTitle")
-    if tag:
-        return tag.get_text(strip=True)
+    tags = _XP_TITLE(tree)
+    if tags:
+        return text_of(tags[0])
     return None
 
 
-def get_price(soup):
+def get_price(tree):
     """Pull the price from <span class="a-price-whole">."""
-    tag = soup.find("span", class_="a-price-whole")
-    if tag:
+    tags = _XP_PRICE(tree)
+    if tags:
         # remove trailing dot that amazon sometimes adds
-        return tag.get_text(strip=True).rstrip(".")
+        return text_of(tags[0]).rstrip(".")
     return None
 
 
-def get_about_items(soup):
+def get_about_items(tree):
     """
     Extract the 'About this item' bullet points.
 
-    Tries two approaches:
+    Tries three approaches:
       1. Find the heading 'About this item' then grab its next <ul>
       2. Fallback: look for the feature-bullets container
+      3. Fallback: direct class match on the <ul>
     """
     bullets = []
 
     # approach 1: heading-based lookup
-    heading = soup.find("h3", string=re.compile(r"About this item", re.IGNORECASE))
-    if heading:
-        ul = heading.find_next("ul", class_=re.compile(r"a-unordered-list"))
-        if ul:
-            bullets = _extract_list_items(ul)
+    ul = _XP_ABOUT_UL(tree)
+    if ul:
+        bullets = _extract_list_items(ul[0])
 
     # approach 2: feature-bullets div
     if not bullets:
-        container = soup.find("div", id="feature-bullets")
-        if container:
-            ul = container.find("ul")
-            if ul:
-                bullets = _extract_list_items(ul)
+        ul = _XP_BULLETS_UL(tree)
+        if ul:
+            bullets = _extract_list_items(ul[0])
 
     # approach 3: direct class match on the <ul>
     if not bullets:
-        ul = soup.find("ul", class_="a-unordered-list a-vertical a-spacing-small")
+        ul = _XP_EXACT_UL(tree)
         if ul:
-            bullets = _extract_list_items(ul)
+            bullets = _extract_list_items(ul[0])
 
     return bullets
 
@@ -61,10 +74,10 @@ def get_about_items(soup):
 def _extract_list_items(ul_tag):
     """Helper - pull text from each <li> inside a <ul>."""
     items = []
-    for li in ul_tag.find_all("li"):
-        span = li.find("span", class_="a-list-item")
+    for li in _XP_LI(ul_tag):
+        span = _XP_LIST_ITEM(li)
         if span:
-            text = span.get_text(strip=True)
+            text = text_of(span[0])
             if text:
                 items.append(text)
     return items
@@ -7,19 +7,39 @@ We grab: profile name, rating, review tag (title), date, and body text.
 
 import re
 
+from lxml import etree
 
-def get_reviews(soup):
+from extract.loader import has_class, text_of
+
+_RE_RATING = re.compile(r"([\d.]+)\s*out of")
+
+_XP_REVIEW_LI = etree.XPath('//li[@data-hook="review"]')
+_XP_REVIEW_DIV = etree.XPath('//div[starts-with(@id, "customer_review-")]')
+_XP_ICON_ALT = etree.XPath(f".//span[{has_class('a-icon-alt')}]")
+_XP_TITLE_SPANS = etree.XPath(f".//span[not({has_class('a-icon-alt')})]")
+_XP_BODY_INNER = etree.XPath('.//div[contains(@class, "review-text-content")]')
+
+# (tag, data-hook) -> field, for the nodes picked up in one walk of a block
+_HOOKED_FIELDS = {
+    ("i", "review-star-rating"): "star",
+    ("a", "review-title"): "title",
+    ("span", "review-date"): "date",
+    ("span", "review-body"): "body",
+}
+
+
+def get_reviews(tree):
     """
-    Extract all reviews from a page's soup.
+    Extract all reviews from a page's tree.
 
     Returns a list of dicts, one per review.
     """
     reviews = []
-    review_blocks = soup.find_all("li", attrs={"data-hook": "review"})
+    review_blocks = _XP_REVIEW_LI(tree)
 
     # also check for div-based review containers (some pages use these)
     if not review_blocks:
-        review_blocks = soup.find_all("div", id=re.compile(r"^customer_review-"))
+        review_blocks = _XP_REVIEW_DIV(tree)
 
     for block in review_blocks:
         review = _parse_single_review(block)
@@ -31,23 +51,24 @@ def get_reviews(soup):
 
 def _parse_single_review(block):
     """Parse one review block and return a dict."""
+    nodes = _index_review_block(block)
 
     # profile name
-    profile_tag = block.find("span", class_="a-profile-name")
-    profile_name = profile_tag.get_text(strip=True) if profile_tag else ""
+    profile_tag = nodes.get("profile")
+    profile_name = text_of(profile_tag) if profile_tag is not None else ""
 
     # star rating (e.g. "5.0 out of 5 stars")
-    rating = _extract_rating(block)
+    rating = _extract_rating(nodes.get("star"))
 
     # review tag / title
-    review_tag = _extract_review_tag(block)
+    review_tag = _extract_review_tag(nodes.get("title"))
 
     # review date
-    date_tag = block.find("span", attrs={"data-hook": "review-date"})
-    review_date = date_tag.get_text(strip=True) if date_tag else ""
+    date_tag = nodes.get("date")
+    review_date = text_of(date_tag) if date_tag is not None else ""
 
     # review body text
-    review_text = _extract_review_text(block)
+    review_text = _extract_review_text(nodes.get("body"))
 
     return {
         "profile_name": profile_name,
@@ -58,39 +79,44 @@ def _parse_single_review(block):
     }
 
 
-def _extract_rating(block):
+def _index_review_block(block):
+    """Walk the block once and keep the first node found for each field."""
+    nodes = {}
+    for el in block.iter("span", "i", "a"):
+        field = _HOOKED_FIELDS.get((el.tag, el.get("data-hook")))
+        if field is None and el.tag == "span":
+            if "a-profile-name" in (el.get("class") or "").split():
+                field = "profile"
+        if field is not None and field not in nodes:
+            nodes[field] = el
+    return nodes
+
+
+def _extract_rating(star_tag):
     """Pull the numeric rating from the star icon."""
-    star_tag = block.find("i", attrs={"data-hook": "review-star-rating"})
-    if star_tag:
-        alt = star_tag.find("span", class_="a-icon-alt")
+    if star_tag is not None:
+        alt = _XP_ICON_ALT(star_tag)
         if alt:
-            text = alt.get_text(strip=True)
-            match = re.search(r"([\d.]+)\s*out of", text)
+            text = text_of(alt[0])
+            match = _RE_RATING.search(text)
             return match.group(1) if match else text
     return None
 
 
-def _extract_review_tag(block):
+def _extract_review_tag(title_link):
     """Pull the review title/tag text (the bold headline)."""
-    title_link = block.find("a", attrs={"data-hook": "review-title"})
-    if title_link:
-        # skip the star-rating span, grab the actual title span
-        for span in title_link.find_all("span"):
-            classes = span.get("class") or []
-            if "a-icon-alt" not in classes:
-                text = span.get_text(strip=True)
-                if text:
-                    return text
-    return ""
-
-
-def _extract_review_text(block):
+    if title_link is None:
+        return ""
+    # skip the star-rating span, grab the first non-empty title span
+    texts = (text_of(span) for span in _XP_TITLE_SPANS(title_link))
+    return next((text for text in texts if text), "")
+
+
+def _extract_review_text(body_tag):
     """Pull the main review body text."""
-    body_tag = block.find("span", attrs={"data-hook": "review-body"})
-    if body_tag:
-        # prefer the inner content div
-        inner = body_tag.find("div", class_=re.compile("review-text-content"))
-        if inner:
-            return inner.get_text(strip=True)
-        return body_tag.get_text(strip=True)
-    return ""
+    if body_tag is None:
+        return ""
+    # prefer the inner content div; either way the text is collected once
+    inner = _XP_BODY_INNER(body_tag)
+    target = inner[0] if inner else body_tag
+    return text_of(target)
@@ -4,71 +4,119 @@ Main entry point - ties everything together.
 Usage:
     python -m extract.run
     python -m extract.run path/to/file.html
+    python -m extract.run path/to/file.html.gz
 
 Reads the latest HTML file, extracts product info + reviews,
 and saves the result as JSON in data/output/.
 """
 
+import os
 import sys
 import json
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-from extract.loader import load_html, split_pages
+from extract.loader import scan_file_sections, parse_html
 from extract.product import get_product_title, get_price, get_about_items
 from extract.reviews import get_reviews
 
+# orjson is optional - much faster on big review lists, same output shape
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 HTML_DIR = BASE_DIR / "data" / "html"
 OUTPUT_DIR = BASE_DIR / "data" / "output"
 
+# page labels that carry the product info
+PRODUCT_LABELS = ("product_page", "full_file")
+
+# below this many pages, worker start-up costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+# pages handed to the worker pool ahead of the ones being collected
+MAX_IN_FLIGHT = 2 * (os.cpu_count() or 1)
+
+
+def extract_page(section, want_product=False):
+    """
+    Parse one page section and pull its data.
+
+    Runs in a worker process for large files, so it takes and returns
+    plain data only. Returns (product_info or None, reviews).
+    """
+    tree = parse_html(section["html"])
+
+    product = None
+    if want_product:
+        product = {
+            "product_title": get_product_title(tree),
+            "price": get_price(tree),
+            "about_this_item": get_about_items(tree),
+        }
+
+    return product, get_reviews(tree)
+
 
 def extract_all(html_filepath):
     """
     Full extraction pipeline.
 
-    1. Load & split the HTML into pages
-    2. Extract product info from product page
-    3. Collect reviews from all pages
+    1. Load the HTML and split it into page sections
+    2. Parse + extract each page (worker processes for large files)
+    3. Take product info from the product page, reviews from every page
     4. Return the combined result dict
     """
-    raw = load_html(html_filepath)
-    pages = split_pages(raw)
+    # labels come from a header-only scan; pages are decoded as they stream
+    labels, sections = scan_file_sections(html_filepath)
 
-    print(f"[+] Loaded {len(pages)} page(s) from {Path(html_filepath).name}")
+    logger.info("[+] Loaded %d page(s) from %s", len(labels), Path(html_filepath).name)
+
+    # only the first product page is used for product info
+    product_index = next(
+        (i for i, label in enumerate(labels) if label in PRODUCT_LABELS), None
+    )
+    want_product = [i == product_index for i in range(len(labels))]
+
+    # -- parse + extract every page (in parallel for large files) --
+    if len(labels) >= PARALLEL_MIN_PAGES:
+        with ProcessPoolExecutor() as pool:
+            results = list(_bounded_map(pool, extract_page, sections, want_product))
+    else:
+        results = list(map(extract_page, sections, want_product))
 
     # -- product info (from the product page) --
-    product_title = None
-    price = None
-    about_items = []
-
-    for page in pages:
-        if page["label"] == "product_page" or page["label"] == "full_file":
-            soup = page["soup"]
-            product_title = get_product_title(soup)
-            price = get_price(soup)
-            about_items = get_about_items(soup)
-            print(f"[+] Product: {product_title}")
-            print(f"[+] Price: {price}")
-            print(f"[+] About items: {len(about_items)} bullet(s)")
-            break
+    product = results[product_index][0] if product_index is not None else {}
+    product_title = product.get("product_title")
+    price = product.get("price")
+    about_items = product.get("about_this_item", [])
+
+    if product_index is not None:
+        logger.info("[+] Product: %s", product_title)
+        logger.info("[+] Price: %s", price)
+        logger.info("[+] About items: %d bullet(s)", len(about_items))
 
     # -- reviews (from all pages that contain them) --
-    all_reviews = []
+    # deduplicate by profile_name + review_tag combo, keeping the first;
+    # set.add() returns None, so "not seen_ids.add(key)" just records it
     seen_ids = set()
+    all_reviews = [
+        r
+        for _, page_reviews in results
+        for r in page_reviews
+        if (key := (r["profile_name"], r["review_tag"])) not in seen_ids
+        and not seen_ids.add(key)
+    ]
 
-    for page in pages:
-        page_reviews = get_reviews(page["soup"])
-        for r in page_reviews:
-            # deduplicate by profile_name + review_tag combo
-            key = (r["profile_name"], r["review_tag"])
-            if key not in seen_ids:
-                seen_ids.add(key)
-                all_reviews.append(r)
-
-    print(f"[+] Reviews found: {len(all_reviews)}")
+    logger.info("[+] Reviews found: %d", len(all_reviews))
 
     # -- build final output --
     result = {
@@ -86,24 +134,27 @@ def save_json(data, output_path):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
-    print(f"[+] Saved: {output_path}")
+    logger.info("[+] Saved: %s", output_path)
 
 
 def main():
     """Pick the HTML file and run extraction."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     # accept a file path as argument, or use the latest one
     if len(sys.argv) > 1:
         html_file = Path(sys.argv[1])
     else:
-        files = sorted(HTML_DIR.glob("amazon_scrape_*.html"), reverse=True)
-        if not files:
+        html_file = _latest_html_file()
+        if html_file is None:
             print("[!] No HTML files found in data/html/. Run the scraper first.")
             return
-        html_file = files[0]
         print(f"[*] Using latest file: {html_file.name}")
 
     # run extraction
@@ -125,5 +176,41 @@ def main():
     print(f"  Output : {output_file}")
 
 
+def _bounded_map(pool, fn, *iterables):
+    """
+    Helper - pool.map that submits lazily, in order.
+
+    pool.map queues every item up front, which would decode every page
+    at once; here at most MAX_IN_FLIGHT tasks are pending at a time.
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= MAX_IN_FLIGHT:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, *args))
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _latest_html_file():
+    """Helper - newest scraper dump in HTML_DIR, or None if there is none."""
+    if not HTML_DIR.is_dir():
+        return None
+
+    # file names carry a sortable timestamp, so the newest is the max name;
+    # one pass over scandir, no sort and no Path per entry
+    with os.scandir(HTML_DIR) as entries:
+        latest = max(
+            (
+                e.name for e in entries
+                if e.name.startswith("amazon_scrape_")
+                and e.name.endswith((".html", ".html.gz"))
+            ),
+            default=None,
+        )
+    return HTML_DIR / latest if latest else None
+
+
 if __name__ == "__main__":
     main()
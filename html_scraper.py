@@ -3,13 +3,14 @@ Entry point — Amazon HTML Scraper.
 
 Usage:
     python html_scraper.py
+    python html_scraper.py URL [URL ...]
 """
 
 import logging
 import sys
 
-from scraper.settings import LOG_FORMAT, LOG_DATE_FORMAT, LOG_LEVEL
-from scraper import AmazonHTMLScraper
+from scraper.settings import LOG_FORMAT, LOG_DATE_FORMAT, LOG_LEVEL, PARALLEL_WORKERS
+from scraper import AmazonHTMLScraper, scrape_in_parallel
 
 # Configure root logger
 logging.basicConfig(
@@ -30,24 +31,33 @@ PRODUCT_URL = (
 
 def main() -> None:
     """Run the scraper."""
-    scraper = AmazonHTMLScraper()
+    product_urls = sys.argv[1:] or [PRODUCT_URL]
+
+    # Several products and workers configured → one browser per process
+    parallel = PARALLEL_WORKERS > 1 and len(product_urls) > 1
+    scraper = None if parallel else AmazonHTMLScraper()
 
     try:
+        if parallel:
+            sys.exit(0 if scrape_in_parallel(product_urls) else 1)
+
         if not scraper.start():
             sys.exit(1)
 
-        success = scraper.scrape_product_to_reviews(PRODUCT_URL)
+        success = scraper.scrape_many(product_urls)
         scraper.stop("Completed successfully" if success else "Failed or blocked")
         sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
-        scraper.stop("User interrupt")
+        if scraper:
+            scraper.stop("User interrupt")
         sys.exit(130)
 
     except Exception as exc:
         logger.exception("Fatal error: %s", exc)
-        scraper.stop(f"Error: {exc}")
+        if scraper:
+            scraper.stop(f"Error: {exc}")
         sys.exit(1)
 
 
@@ -2,9 +2,9 @@
 scraper — Amazon HTML scraper package.
 
 Public API:
-    from scraper import AmazonHTMLScraper
+    from scraper import AmazonHTMLScraper, scrape_in_parallel
 """
 
-from scraper.worker import AmazonHTMLScraper
+from scraper.worker import AmazonHTMLScraper, scrape_in_parallel
 
-__all__ = ["AmazonHTMLScraper"]
+__all__ = ["AmazonHTMLScraper", "scrape_in_parallel"]
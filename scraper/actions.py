@@ -1,17 +1,28 @@
 """
-Human-like browser actions — scrolling, random waits, viewport checks.
+Human-like browser actions — scrolling and random waits.
 """
 
 import logging
 import random
 import time
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
-from scraper.settings import SCROLL_STEP, SCROLL_PAUSE
+from scraper.settings import (
+    LOAD_SETTLE,
+    LOAD_TIMEOUT,
+    LOAD_TAIL,
+    SCROLL_STEP,
+    SCROLL_PAUSE,
+    GESTURE_STEP,
+    GESTURE_SPEED,
+    SEARCH_TIMEOUT,
+)
+from scraper.detection import CAPTCHA_PATTERN
 
 logger = logging.getLogger(__name__)
 
@@ -28,98 +39,240 @@ def random_wait(min_sec: float, max_sec: float, reason: str = "") -> None:
     time.sleep(wait_time)
 
 
-def is_element_in_viewport(driver: WebDriver, element: WebElement) -> bool:
-    """Return *True* when *element* is inside the current viewport."""
+def wait_until_loaded(
+    driver: WebDriver,
+    reason: str = "",
+    stale_element: WebElement | None = None,
+) -> None:
+    """
+    Wait for the current page to finish loading, at a human pace.
+
+    A short random settle pause, then ``document.readyState`` is polled
+    every 200 ms until it is ``"complete"`` (at most ``LOAD_TIMEOUT``
+    seconds), then a small random tail.  Fast pages cost ~1–2 s instead
+    of a fixed 5–10 s sleep.
+
+    After a click the old document still reports ``"complete"``; pass an
+    element of that document as *stale_element* and the readyState poll
+    only starts once it has been detached by the navigation.
+    """
+    random_wait(LOAD_SETTLE[0], LOAD_SETTLE[1], reason)
     try:
-        return driver.execute_script(
-            """
-            var elem = arguments[0];
-            var rect = elem.getBoundingClientRect();
-            var wh   = window.innerHeight || document.documentElement.clientHeight;
-            return (rect.top >= 0 && rect.top <= wh);
-            """,
-            element,
+        if stale_element is not None:
+            WebDriverWait(driver, LOAD_TIMEOUT, poll_frequency=0.2).until(
+                EC.staleness_of(stale_element)
+            )
+        WebDriverWait(driver, LOAD_TIMEOUT, poll_frequency=0.2).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
         )
-    except Exception:
-        return False
+    except TimeoutException:
+        logger.debug("Page still loading after %ds (%s).", LOAD_TIMEOUT, reason)
+    time.sleep(random.uniform(LOAD_TAIL[0], LOAD_TAIL[1]))
 
 
 # ---------------------------------------------------------------------------
 # Scrolling
 # ---------------------------------------------------------------------------
 
-def human_scroll(
+# Jump straight to the first match of a CSS selector, if it is already in
+# the DOM; returns the element, or null when there is no match.
+_SCROLL_INTO_VIEW_JS = """
+var el = document.querySelector(arguments[0]);
+if (el) { el.scrollIntoView({block: 'center'}); }
+return el;
+"""
+
+
+def scroll_to_element(driver: WebDriver, css_selector: str) -> WebElement | None:
+    """
+    Fast path: bring *css_selector*'s element into view in one round-trip.
+
+    Returns the element when it is already rendered, else *None* — the
+    caller then falls back to a scrolling search to trigger lazy loading.
+    """
+    try:
+        element = driver.execute_script(_SCROLL_INTO_VIEW_JS, css_selector)
+    except Exception as exc:
+        logger.debug("Fast-path scroll failed: %s", exc)
+        return None
+
+    if element is not None:
+        logger.info("Target already in DOM — scrolled straight to it.")
+    return element
+
+
+# ---------------------------------------------------------------------------
+# Gesture scrolling
+# ---------------------------------------------------------------------------
+
+_SCROLL_STATE_JS = (
+    "return [window.pageYOffset,"
+    " document.body.scrollHeight - window.innerHeight - window.pageYOffset];"
+)
+
+
+def gesture_scroll(driver: WebDriver) -> None:
+    """
+    Scroll to the bottom of the page with the timing loop in the browser.
+
+    Uses a few synthesized CDP wheel gestures; distance and speed are
+    randomised per gesture instead of per tick.
+    """
+    logger.info("Starting gesture scrolling …")
+    gestures = 0
+    position, remaining = driver.execute_script(_SCROLL_STATE_JS)
+
+    while remaining > 0:
+        gestures += 1
+        distance = min(remaining, random.randint(GESTURE_STEP[0], GESTURE_STEP[1]))
+        driver.execute_cdp_cmd(
+            "Input.synthesizeScrollGesture",
+            {
+                "x": 200,
+                "y": 200,
+                "yDistance": -distance,
+                "speed": random.randint(GESTURE_SPEED[0], GESTURE_SPEED[1]),
+                "gestureSourceType": "mouse",
+            },
+        )
+        time.sleep(random.uniform(SCROLL_PAUSE[0], SCROLL_PAUSE[1]))
+
+        # Page might lazy-load more content; stop if the gesture went nowhere
+        previous, (position, remaining) = position, driver.execute_script(_SCROLL_STATE_JS)
+        if position <= previous:
+            break
+
+    logger.info("Scrolling complete — %d gestures.", gestures)
+
+
+# ---------------------------------------------------------------------------
+# In-page search
+# ---------------------------------------------------------------------------
+
+# Async in-page scroll loop.  Every tick it scrolls by a random step and
+# waits a random pause, then calls back once with a terminal outcome:
+#   found   – the target (arguments[0]) is in the viewport (returns it)
+#   bottom  – end of page reached without seeing the target
+#   blocked – login/CAPTCHA URL, or CAPTCHA copy (checked every 5 ticks)
+#   timeout – arguments[5] seconds passed; no tick is scheduled after it
+# arguments[4] seeds the randomisation when not null.
+_SCROLL_SEARCH_JS = """
+var xpath = arguments[0], step = arguments[1], pause = arguments[2];
+var captcha = new RegExp(arguments[3], "i");
+var deadline = Date.now() + arguments[5] * 1000;
+var done = arguments[arguments.length - 1];
+var scrolls = 0, target = null;
+var random = Math.random;
+if (arguments[4] !== null) {
+    // mulberry32: small seeded PRNG, so a seed replays the same run
+    var state = arguments[4] | 0;
+    random = function () {
+        state = (state + 0x6D2B79F5) | 0;
+        var t = Math.imul(state ^ (state >>> 15), 1 | state);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+function rand(range) { return range[0] + random() * (range[1] - range[0]); }
+function finish(outcome, el, reason) {
+    done({outcome: outcome, element: el, reason: reason, scrolls: scrolls});
+}
+function visible() {
+    // the resolved node is reused until the page detaches it
+    if (!target || !document.contains(target)) {
+        target = document.evaluate(
+            xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    if (!target) { return null; }
+    var rect = target.getBoundingClientRect();
+    var wh   = window.innerHeight || document.documentElement.clientHeight;
+    return (rect.top >= 0 && rect.top <= wh) ? target : null;
+}
+function blockReason() {
+    var url = window.location.href.toLowerCase();
+    if (url.indexOf("/ap/signin") !== -1) { return "Login redirect detected"; }
+    if (url.indexOf("captcha") !== -1) { return "CAPTCHA URL detected"; }
+    if (scrolls % 5 === 0 && document.body && captcha.test(document.body.innerText)) {
+        return "CAPTCHA text detected";
+    }
+    return null;
+}
+function tick() {
+    if (Date.now() >= deadline) { finish("timeout", null, null); return; }
+    var reason = blockReason();
+    if (reason) { finish("blocked", null, reason); return; }
+    var el = visible();
+    if (el) { finish("found", el, null); return; }
+    if (window.innerHeight + window.pageYOffset >= document.body.scrollHeight - 1) {
+        finish("bottom", null, null);
+        return;
+    }
+    scrolls++;
+    window.scrollBy({top: Math.round(rand(step)), behavior: 'smooth'});
+    setTimeout(settle, rand(pause) * 1000);
+}
+function settle() {
+    // occasional tiny scroll-back (human behaviour)
+    if (random() < 0.1) {
+        window.scrollBy(0, -Math.round(rand([30, 80])));
+        setTimeout(tick, 300);
+    } else {
+        tick();
+    }
+}
+tick();
+"""
+
+
+def search_scroll(
     driver: WebDriver,
-    target_xpath: str | None = None,
-    stop_on_find: bool = True,
-) -> WebElement | None:
+    target_xpath: str,
+    seed: int | None = None,
+) -> tuple[str, WebElement | None]:
     """
-    Scroll the page like a human would.
+    Scroll down until *target_xpath* is in the viewport, entirely in-page.
+
+    The whole loop — scroll ticks, reading pauses, visibility and block
+    checks — runs in one async script, so control returns to Python once.
 
     Parameters
     ----------
     driver : WebDriver
         Active browser session.
-    target_xpath : str, optional
-        XPath of an element to search for while scrolling.
-    stop_on_find : bool
-        If *True*, stop scrolling as soon as *target_xpath* is found in the
-        viewport.
+    target_xpath : str
+        XPath of the element to scroll to.
+    seed : int, optional
+        Seed for the scroll/pause randomisation, to replay a run while
+        debugging.
 
     Returns
     -------
-    WebElement or None
-        The found element, or *None* if it was never encountered.
+    (outcome, element) : tuple[str, WebElement | None]
+        *outcome* is ``"found"``, ``"bottom"``, ``"blocked"`` or
+        ``"timeout"``; *element* is set only when the target was found.
     """
-    logger.info("Starting human-like scrolling …")
-
-    total_height = driver.execute_script("return document.body.scrollHeight")
-    viewport_height = driver.execute_script("return window.innerHeight")
-    current_pos = 0
-    scroll_count = 0
-    found_element: WebElement | None = None
-
-    while current_pos < total_height - viewport_height:
-        scroll_count += 1
+    logger.info("Scrolling in-page until target is visible …")
 
-        # Random scroll amount
-        scroll_amount = random.randint(SCROLL_STEP[0], SCROLL_STEP[1])
-        current_pos += scroll_amount
-
-        # Smooth scroll
-        driver.execute_script(
-            f"window.scrollTo({{top: {current_pos}, behavior: 'smooth'}});"
+    # The script stops itself at SEARCH_TIMEOUT; the driver's script
+    # timeout (set in create_driver) is only a backstop.
+    try:
+        result = driver.execute_async_script(
+            _SCROLL_SEARCH_JS,
+            target_xpath, SCROLL_STEP, SCROLL_PAUSE, CAPTCHA_PATTERN, seed,
+            SEARCH_TIMEOUT,
         )
+    except TimeoutException:
+        logger.warning("In-page search did not call back in time.")
+        return "timeout", None
 
-        # Reading pause
-        time.sleep(random.uniform(SCROLL_PAUSE[0], SCROLL_PAUSE[1]))
-
-        progress = min(100, int((current_pos / total_height) * 100))
-        logger.debug(
-            "Scroll %d: %dpx / %dpx (%d%%)",
-            scroll_count, current_pos, total_height, progress,
-        )
+    outcome = result["outcome"]
+    if outcome == "found":
+        logger.info("Target element found in viewport.")
+    elif outcome == "blocked":
+        logger.warning("Blocked while scrolling: %s", result["reason"])
+    elif outcome == "timeout":
+        logger.warning("In-page search timed out after %ds.", SEARCH_TIMEOUT)
 
-        # Check for target element
-        if target_xpath and stop_on_find:
-            try:
-                element = driver.find_element(By.XPATH, target_xpath)
-                if is_element_in_viewport(driver, element):
-                    logger.info("Target element found in viewport.")
-                    found_element = element
-                    break
-            except NoSuchElementException:
-                pass
-
-        # Occasional tiny scroll-back (human behaviour)
-        if random.random() < 0.1:
-            back = random.randint(30, 80)
-            current_pos = max(0, current_pos - back)
-            driver.execute_script(f"window.scrollTo(0, {current_pos});")
-            time.sleep(0.3)
-
-        # Page might lazy-load more content
-        total_height = driver.execute_script("return document.body.scrollHeight")
-
-    logger.info("Scrolling complete — %d scroll ticks.", scroll_count)
-    return found_element
+    logger.info("Scrolling complete — %d scroll ticks.", result["scrolls"])
+    return outcome, result["element"]
@@ -3,6 +3,7 @@ Block / CAPTCHA detection helpers.
 """
 
 import logging
+import re
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
@@ -15,18 +16,44 @@ _CAPTCHA_INDICATORS = [
     "sorry, we just need to make sure you're not a robot",
 ]
 
+# All indicators as one alternation, matched case-insensitively in-page
+CAPTCHA_PATTERN = "|".join(re.escape(s) for s in _CAPTCHA_INDICATORS)
+
+# Returns [url, first matching indicator or null, HTML length] in one
+# round-trip; the indicator pattern is passed as arguments[0].  Indicators
+# are visible copy, so only the rendered text is scanned — not the full HTML.
+# The length is only computed (serialising the DOM in-page) when no
+# indicator matched, since it is not needed otherwise.
+_BLOCK_CHECK_JS = """
+var text = document.body ? document.body.innerText : "";
+var match = text.match(new RegExp(arguments[0], "i"));
+var hit = match ? match[0].toLowerCase() : null;
+var size = hit ? null : document.documentElement.outerHTML.length;
+return [window.location.href, hit, size];
+"""
+
 
 def check_for_blocks(driver: WebDriver) -> tuple[bool, str | None]:
     """
     Inspect the current page for signs of blocking.
 
+    All signals are gathered by a single in-page script, so the page HTML
+    never has to cross the WebDriver boundary.
+
     Returns
     -------
     (is_blocked, reason) : tuple[bool, str | None]
         *is_blocked* is ``True`` when the page looks like a login redirect,
         CAPTCHA challenge, or suspiciously small stub.
     """
-    url = driver.current_url.lower()
+    try:
+        url, indicator, size = driver.execute_script(
+            _BLOCK_CHECK_JS, CAPTCHA_PATTERN,
+        )
+    except Exception as exc:
+        return True, f"Error reading page: {exc}"
+
+    url = url.lower()
 
     # Login / register redirect
     if "/ap/signin" in url or "/ap/register" in url:
@@ -36,17 +63,10 @@ def check_for_blocks(driver: WebDriver) -> tuple[bool, str | None]:
     if "captcha" in url:
         return True, "CAPTCHA URL detected"
 
-    try:
-        source = driver.page_source.lower()
-
-        for indicator in _CAPTCHA_INDICATORS:
-            if indicator in source:
-                return True, f"CAPTCHA detected: {indicator}"
+    if indicator:
+        return True, f"CAPTCHA detected: {indicator}"
 
-        if len(source) < 5_000:
-            return True, f"Page suspiciously small: {len(source)} bytes"
-
-    except Exception as exc:
-        return True, f"Error reading page: {exc}"
+    if size < 5_000:
+        return True, f"Page suspiciously small: {size} bytes"
 
     return False, None
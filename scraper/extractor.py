@@ -4,30 +4,35 @@ HTML extraction — append each page's source to a single output file.
 
 import logging
 from datetime import datetime
-from pathlib import Path
+from typing import BinaryIO
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from scraper.settings import OUTPUT_DIR
-
 logger = logging.getLogger(__name__)
 
 
 def save_html_to_single_file(
     driver: WebDriver,
-    output_file: Path,
+    out: BinaryIO,
     page_label: str,
+    html: str | None = None,
+    url: str | None = None,
 ) -> int:
     """
-    Append the current page's HTML to *output_file* with a metadata separator.
+    Append the current page's HTML to *out* with a metadata separator.
+
+    *out* is the scraper's output file, opened once in binary append mode
+    and kept open for the whole run; the text is encoded here as UTF-8.
+
+    Pass *html* / *url* when the caller already holds the page source or
+    current URL, to skip a second transfer of either.
 
     Returns the number of bytes written.
     """
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    html = driver.page_source
+    if html is None:
+        html = driver.page_source
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    current_url = driver.current_url
+    current_url = url if url is not None else driver.current_url
 
     separator = (
         f"\n\n{'=' * 80}\n"
@@ -38,9 +43,8 @@ def save_html_to_single_file(
         f"{'=' * 80}\n\n"
     )
 
-    with open(output_file, "a", encoding="utf-8") as fh:
-        fh.write(separator)
-        fh.write(html)
+    # one encode and one write per page (separator + page together)
+    out.write((separator + html).encode("utf-8"))
 
     logger.info("HTML appended  %-25s  %s bytes", page_label, f"{len(html):,}")
     return len(html)
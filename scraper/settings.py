@@ -6,6 +6,7 @@ every other module can just ``from scraper.settings import …``.
 """
 
 import logging
+import os
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -23,14 +24,44 @@ PROFILE_DIR = BASE_DIR / "profiles" / "amazon_home"
 OUTPUT_DIR = BASE_DIR / "data" / "html"
 CHROME_BINARY = r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
 
+# Write the combined HTML as .html.gz (level 1: cheap, still ~8x smaller)
+GZIP_OUTPUT = True
+
+# ---------------------------------------------------------------------------
+# Site
+# ---------------------------------------------------------------------------
+# Storefront used to resolve relative links when the product URL has no
+# host of its own; override with the AMAZON_DOMAIN environment variable.
+AMAZON_DOMAIN = os.environ.get("AMAZON_DOMAIN", "amazon.in")
+
 # ---------------------------------------------------------------------------
 # Timing (seconds) — kept fast but human-looking
 # ---------------------------------------------------------------------------
-PAGE_LOAD_WAIT = (5, 10)       # after a page load
+LOAD_SETTLE = (0.8, 1.5)       # pause before polling for page load
+LOAD_TIMEOUT = 10              # max seconds to wait for readyState "complete"
+LOAD_TAIL = (0.3, 0.8)         # jitter once the page reports loaded
 SCROLL_STEP = (300, 500)       # pixels per scroll tick
 SCROLL_PAUSE = (0.3, 0.8)     # pause between scroll ticks
 ACTION_WAIT = (2, 4)           # before clicking a link
-AFTER_CLICK_WAIT = (5, 10)    # after clicking a link
+PAGE_INTERVAL = (20, 30)       # min seconds between page loads (config/limit.md)
+GESTURE_STEP = (1200, 2400)    # pixels per synthesized scroll gesture
+GESTURE_SPEED = (1500, 3000)   # gesture speed, pixels per second
+SEARCH_TIMEOUT = 120           # max seconds for an in-page target search
+ELEMENT_WAIT = 5               # max seconds an explicit element wait polls
+
+# ---------------------------------------------------------------------------
+# Network
+# ---------------------------------------------------------------------------
+# Only the HTML is saved, so heavy subresources are blocked via CDP.
+# Stylesheets are left alone: the viewport checks (getBoundingClientRect) and
+# the next-page visibility scan (getClientRects, getComputedStyle) need layout.
+BLOCK_ASSETS = True
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.mp4",
+    "*google-analytics*", "*doubleclick*", "*amazon-adsystem*",
+]
 
 # ---------------------------------------------------------------------------
 # Selectors
@@ -41,7 +72,8 @@ SEE_MORE_REVIEWS_CSS = "a[data-hook='see-all-reviews-link-foot']"
 NEXT_PAGE_XPATH = "//a[contains(text(), 'Next page')]"
 NEXT_PAGE_CSS = "li.a-last a"
 
-# Fallback selectors tried when the primary ones miss
+# Fallback selectors tried when the primary ones miss, in priority order
+# (checked strictly in this order, never as one union)
 NEXT_PAGE_FALLBACKS: list[tuple[str, str]] = [
     ("xpath", "//li[@class='a-last']/a"),
     ("xpath", "//a[contains(text(), 'Next page')]"),
@@ -56,3 +88,13 @@ NEXT_PAGE_FALLBACKS: list[tuple[str, str]] = [
 # Limits
 # ---------------------------------------------------------------------------
 MAX_REVIEW_PAGES = 500
+
+# ---------------------------------------------------------------------------
+# Parallelism
+# ---------------------------------------------------------------------------
+# Browser processes used for a multi-product run (1 = one shared session).
+# Each extra worker gets its own copy of the Chrome profile, refreshed
+# whenever the main profile's cookies are newer (e.g. after a new login).
+# Keep at 1 for a home IP — config/limit.md allows one browser instance.
+PARALLEL_WORKERS = 1
+PARALLEL_STAGGER = 20          # seconds between worker start-ups
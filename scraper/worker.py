@@ -5,41 +5,125 @@ Coordinates the driver, human-like actions, block detection, and HTML
 extraction into a single high-level workflow.
 """
 
+import gzip
 import logging
+import random
 import re
+import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
 from scraper.settings import (
+    LOG_LEVEL,
+    LOG_FORMAT,
+    LOG_DATE_FORMAT,
+    PROFILE_DIR,
     OUTPUT_DIR,
-    PAGE_LOAD_WAIT,
+    AMAZON_DOMAIN,
+    GZIP_OUTPUT,
     ACTION_WAIT,
-    AFTER_CLICK_WAIT,
+    PAGE_INTERVAL,
+    ELEMENT_WAIT,
     MAX_REVIEW_PAGES,
     SEE_MORE_REVIEWS_XPATH,
     SEE_MORE_REVIEWS_CSS,
     NEXT_PAGE_XPATH,
+    NEXT_PAGE_CSS,
     NEXT_PAGE_FALLBACKS,
+    PARALLEL_WORKERS,
+    PARALLEL_STAGGER,
 )
 from scraper.driver import create_driver
-from scraper.actions import random_wait, human_scroll
+from scraper.actions import (
+    random_wait,
+    wait_until_loaded,
+    gesture_scroll,
+    search_scroll,
+    scroll_to_element,
+)
 from scraper.detection import check_for_blocks
 from scraper.extractor import save_html_to_single_file
 
 logger = logging.getLogger(__name__)
 
+_ASIN_RE = re.compile(r"/product-reviews/([A-Z0-9]{10})")
+
+# "No reviews" markers, matched without lowercasing the whole page
+_NO_CUSTOMER_REVIEWS_RE = re.compile(r"there are no customer reviews", re.IGNORECASE)
+_NO_REVIEWS_RE = re.compile(r"no reviews", re.IGNORECASE)
+
+_WRITE_BUFFER = 1 << 20
+
+# Chrome's cookie database inside a profile (newer builds, then older)
+_COOKIE_STORES = ("Default/Network/Cookies", "Default/Cookies")
+
+# Number of reviews on the page (review-body blocks as the fallback), as
+# a plain int instead of a list of element handles
+_REVIEW_COUNT_JS = """
+var n = document.querySelectorAll("div[data-hook='review']").length;
+return n || document.querySelectorAll("[data-hook='review-body']").length;
+"""
+
+# First displayed match of a list of [kind, selector] locators (arguments[0]),
+# tried strictly in list order — an XPath union or CSS selector group would
+# return nodes in document order instead, letting a broad fallback that
+# happens to come earlier in the page win.  Returns [element, index] or null.
+_FIRST_DISPLAYED_JS = """
+var locators = arguments[0];
+function displayed(el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+for (var i = 0; i < locators.length; i++) {
+    var kind = locators[i][0], selector = locators[i][1], nodes = [];
+    if (kind === "xpath") {
+        var snap = document.evaluate(
+            selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (var j = 0; j < snap.snapshotLength; j++) { nodes.push(snap.snapshotItem(j)); }
+    } else {
+        nodes = document.querySelectorAll(selector);
+    }
+    for (var k = 0; k < nodes.length; k++) {
+        if (displayed(nodes[k])) { return [nodes[k], i]; }
+    }
+}
+return null;
+"""
+
+# Scroll the Next button (arguments[0]) into view and return
+# [its href or null, the current URL] in the same round-trip
+_PREPARE_CLICK_JS = """
+var el = arguments[0];
+el.scrollIntoView({behavior: 'smooth', block: 'center'});
+return [el.href || null, window.location.href];
+"""
+
 
 class AmazonHTMLScraper:
     """Scrape an Amazon product page and all its review pages into one HTML file."""
 
-    def __init__(self) -> None:
+    def __init__(self, profile_dir: Path = PROFILE_DIR, file_tag: str = "") -> None:
+        self.profile_dir = profile_dir
+        self.file_tag = file_tag        # appended to output file names
         self.driver = None
+        self.base_url = f"https://www.{AMAZON_DOMAIN}"
         self.output_file = None
+        self._out_fh = None
         self.total_pages: int = 0
         self.total_bytes: int = 0
+        # lookup name -> (kind, selector) that matched last time; tried first
+        self._selector_hits: dict[str, tuple[str, str]] = {}
+        self._last_navigation: float | None = None   # time.monotonic()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -51,16 +135,8 @@ class AmazonHTMLScraper:
         logger.info("AMAZON HTML SCRAPER")
         logger.info("=" * 60)
 
-        self.driver = create_driver()
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_file = OUTPUT_DIR / f"amazon_scrape_{timestamp}.html"
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-        with open(self.output_file, "w", encoding="utf-8") as fh:
-            fh.write(f"<!-- Amazon HTML Scrape Started: {datetime.now()} -->\n")
-
-        logger.info("Output file: %s", self.output_file)
+        self.driver = create_driver(profile_dir=self.profile_dir)
+        self._open_output_file()
         return True
 
     def stop(self, reason: str = "Complete") -> None:
@@ -72,6 +148,8 @@ class AmazonHTMLScraper:
         logger.info("Total pages : %d", self.total_pages)
         logger.info("Total size  : %s bytes", f"{self.total_bytes:,}")
 
+        self._close_output_file()
+
         if self.driver:
             self.driver.quit()
             self.driver = None
@@ -82,6 +160,23 @@ class AmazonHTMLScraper:
     # Main workflow
     # ------------------------------------------------------------------
 
+    def scrape_many(self, product_urls: list[str]) -> bool:
+        """
+        Scrape several products with the same browser session.
+
+        Each product gets its own output file.  Stops at the first product
+        that fails or gets blocked.  Returns *True* if all succeeded.
+        """
+        for index, product_url in enumerate(product_urls):
+            if index > 0:
+                self._open_output_file()
+
+            logger.info("PRODUCT %d / %d", index + 1, len(product_urls))
+            if not self.scrape_product_to_reviews(product_url):
+                return False
+
+        return True
+
     def scrape_product_to_reviews(self, product_url: str) -> bool:
         """
         End-to-end workflow:
@@ -93,17 +188,23 @@ class AmazonHTMLScraper:
         Returns *True* on success.
         """
 
+        # Relative links resolve against the product's own storefront
+        parsed = urlparse(product_url)
+        if parsed.scheme and parsed.netloc:
+            self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+
         # --- Step 1: Product page -----------------------------------------
         logger.info("STEP 1: LOAD PRODUCT PAGE")
         logger.info("URL: %s", product_url[:80])
 
+        self._pace_navigation()
         try:
             self.driver.get(product_url)
         except TimeoutException:
             logger.error("Page load timeout.")
             return False
 
-        random_wait(PAGE_LOAD_WAIT[0], PAGE_LOAD_WAIT[1], "page load")
+        wait_until_loaded(self.driver, "page load")
 
         is_blocked, reason = check_for_blocks(self.driver)
         if is_blocked:
@@ -111,58 +212,64 @@ class AmazonHTMLScraper:
             return False
 
         logger.info("Saving product page HTML …")
-        size = save_html_to_single_file(self.driver, self.output_file, "product_page")
+        size = save_html_to_single_file(self.driver, self._out_fh, "product_page")
         self.total_pages += 1
         self.total_bytes += size
 
         # --- Step 2: Find "See more reviews" ------------------------------
         logger.info("STEP 2: SCROLL TO FIND 'SEE MORE REVIEWS'")
 
-        see_more = human_scroll(
-            self.driver,
-            target_xpath=SEE_MORE_REVIEWS_XPATH,
-            stop_on_find=True,
-        )
+        # Already rendered → jump to it; otherwise scroll until it loads
+        see_more = scroll_to_element(self.driver, SEE_MORE_REVIEWS_CSS)
+        if see_more is None:
+            outcome, see_more = search_scroll(self.driver, SEE_MORE_REVIEWS_XPATH)
+            if outcome == "blocked":
+                return False
 
         if not see_more:
             try:
-                see_more = self.driver.find_element(By.CSS_SELECTOR, SEE_MORE_REVIEWS_CSS)
-            except NoSuchElementException:
+                see_more = WebDriverWait(self.driver, ELEMENT_WAIT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, SEE_MORE_REVIEWS_CSS))
+                )
+            except TimeoutException:
                 logger.error("'See more reviews' link not found.")
                 return False
 
         href = see_more.get_attribute("href")
-        logger.info("Found link href: %s", href[:70] if href else href)
+        if not href:
+            logger.error("'See more reviews' link has no href.")
+            return False
+        logger.info("Found link href: %s", href[:70])
 
         random_wait(ACTION_WAIT[0], ACTION_WAIT[1], "before navigation")
 
         # --- Step 3: Navigate to reviews page 1 ---------------------------
         logger.info("STEP 3: NAVIGATE TO REVIEWS PAGE 1")
 
-        if href.startswith("/"):
-            href = "https://www.amazon.in" + href
+        href = urljoin(self.base_url, href)
 
+        self._pace_navigation()
         self.driver.get(href)
-        random_wait(AFTER_CLICK_WAIT[0], AFTER_CLICK_WAIT[1], "reviews page load")
+        wait_until_loaded(self.driver, "reviews page load")
 
         is_blocked, reason = check_for_blocks(self.driver)
         if is_blocked:
             logger.warning("BLOCKED: %s", reason)
             return False
 
-        asin_match = re.search(r"/product-reviews/([A-Z0-9]{10})", self.driver.current_url)
+        asin_match = _ASIN_RE.search(self.driver.current_url)
         asin = asin_match.group(1) if asin_match else "UNKNOWN"
         logger.info("Detected ASIN: %s", asin)
 
         # --- Step 4: Scroll reviews page 1 --------------------------------
         logger.info("STEP 4: SCROLL REVIEWS PAGE 1")
-        human_scroll(self.driver, target_xpath=None, stop_on_find=False)
+        gesture_scroll(self.driver)
 
         self.driver.execute_script("window.scrollTo(0, 0);")
         time.sleep(1)
 
         logger.info("Saving reviews page 1 HTML …")
-        size = save_html_to_single_file(self.driver, self.output_file, "reviews_page_1")
+        size = save_html_to_single_file(self.driver, self._out_fh, "reviews_page_1")
         self.total_pages += 1
         self.total_bytes += size
 
@@ -172,12 +279,12 @@ class AmazonHTMLScraper:
         while page_number < MAX_REVIEW_PAGES:
             logger.info("PROCESSING REVIEWS PAGE %d", page_number)
 
-            # A – scroll down
-            next_el = human_scroll(
-                self.driver,
-                target_xpath=NEXT_PAGE_XPATH,
-                stop_on_find=True,
-            )
+            # A – jump to the button, or scroll down until it shows up
+            next_el = scroll_to_element(self.driver, NEXT_PAGE_CSS)
+            if next_el is None:
+                outcome, next_el = search_scroll(self.driver, NEXT_PAGE_XPATH)
+                if outcome == "blocked":
+                    break
 
             # B – fallback selectors
             if not next_el:
@@ -188,36 +295,39 @@ class AmazonHTMLScraper:
                 logger.info("No 'Next page' button — reached last page.")
                 break
 
-            if self._is_blocked_or_redirected():
-                break
-
             self._log_review_count(page_number)
 
-            # D – scroll to button & click
+            # D – scroll to button & click (stops here if blocked/redirected)
             next_href = self._click_next_page(next_el)
             if next_href is None:
                 break
 
-            # E – wait for next page
-            random_wait(AFTER_CLICK_WAIT[0], AFTER_CLICK_WAIT[1], "page load")
+            # E – wait for next page (the old page's button must go stale)
+            wait_until_loaded(self.driver, "page load", stale_element=next_el)
 
+            # Read once per page; reused for the log line and the save
             current_url = self.driver.current_url
             if current_url == next_href:
                 logger.warning("URL unchanged after click.")
                 time.sleep(3)
-                if self.driver.current_url == next_href:
+                current_url = self.driver.current_url
+                if current_url == next_href:
                     logger.warning("Page did not change — stopping.")
                     break
+                wait_until_loaded(self.driver, "late page load")
 
             page_number += 1
-            logger.info("Current URL: %s", self.driver.current_url[:80])
+            logger.info("Current URL: %s", current_url[:80])
 
-            if self._looks_like_last_page():
+            # One page_source snapshot serves the last-page check and the save
+            html = self.driver.page_source
+            if self._looks_like_last_page(html):
                 break
 
             # F – save HTML
             size = save_html_to_single_file(
-                self.driver, self.output_file, f"reviews_page_{page_number}"
+                self.driver, self._out_fh, f"reviews_page_{page_number}",
+                html=html, url=current_url,
             )
             self.total_pages += 1
             self.total_bytes += size
@@ -232,24 +342,67 @@ class AmazonHTMLScraper:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _open_output_file(self) -> None:
+        """Create a fresh timestamped output file and keep it open for appends."""
+        self._close_output_file()
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = ".html.gz" if GZIP_OUTPUT else ".html"
+        self.output_file = OUTPUT_DIR / f"amazon_scrape_{timestamp}{self.file_tag}{suffix}"
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Binary, kept open: no text-layer encoder, and one open/close per
+        # product instead of one per saved page.  The gzip stream is only
+        # complete once closed in stop().
+        if GZIP_OUTPUT:
+            self._out_fh = gzip.open(self.output_file, "wb", compresslevel=1)
+        else:
+            self._out_fh = open(self.output_file, "wb", buffering=_WRITE_BUFFER)
+        self._out_fh.write(
+            f"<!-- Amazon HTML Scrape Started: {datetime.now()} -->\n".encode("utf-8")
+        )
+
+        logger.info("Output file: %s", self.output_file)
+
+    def _close_output_file(self) -> None:
+        """Flush and close the current output file, if one is open."""
+        if self._out_fh is not None:
+            self._out_fh.close()
+            self._out_fh = None
+
     def _find_next_page_button(self):
-        """Try every fallback selector for the 'Next page' link."""
+        """Try every fallback selector for the 'Next page' link, in order."""
         logger.debug("Looking for 'Next page' button (fallbacks) …")
-        for kind, selector in NEXT_PAGE_FALLBACKS:
-            try:
-                if kind == "xpath":
-                    el = self.driver.find_element(By.XPATH, selector)
-                else:
-                    el = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if el and el.is_displayed():
-                    logger.debug("Found via %s: %s", kind, selector)
-                    return el
-            except NoSuchElementException:
-                continue
-        return None
-
-    def _is_blocked_or_redirected(self) -> bool:
-        url = self.driver.current_url
+
+        # Pagination markup is the same on every page of a product, so the
+        # locator that won last time goes first; the rest keep their order.
+        # It is part of the same script, so a miss costs no extra query.
+        hit = self._selector_hits.get("next_page")
+        locators = NEXT_PAGE_FALLBACKS
+        if hit:
+            locators = [hit] + [loc for loc in NEXT_PAGE_FALLBACKS if loc != hit]
+
+        # All fallbacks in one script per poll, in priority order; polled
+        # for up to ELEMENT_WAIT seconds in case the button renders late
+        def first_displayed(driver):
+            return driver.execute_script(_FIRST_DISPLAYED_JS, locators) or False
+
+        try:
+            el, index = WebDriverWait(
+                self.driver,
+                ELEMENT_WAIT,
+                poll_frequency=0.25,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(first_displayed)
+        except TimeoutException:
+            return None
+
+        hit = tuple(locators[index])
+        logger.debug("Found via %s: %s", *hit)
+        self._selector_hits["next_page"] = hit
+        return el
+
+    def _is_blocked_or_redirected(self, url: str) -> bool:
         if "/errors/validateCaptcha" in url or "captcha" in url.lower():
             logger.warning("CAPTCHA detected — stopping.")
             return True
@@ -258,33 +411,54 @@ class AmazonHTMLScraper:
             return True
         return False
 
+    def _pace_navigation(self) -> None:
+        """
+        Hold page loads to one per ``PAGE_INTERVAL`` seconds.
+
+        config/limit.md allows 1 page per 20–30 seconds; the random waits
+        alone come nowhere near that, so sleep off whatever is left since
+        the previous navigation.
+        """
+        if self._last_navigation is not None:
+            interval = random.uniform(PAGE_INTERVAL[0], PAGE_INTERVAL[1])
+            remaining = interval - (time.monotonic() - self._last_navigation)
+            if remaining > 0:
+                logger.info("Pacing: next page in %.1fs …", remaining)
+                time.sleep(remaining)
+        self._last_navigation = time.monotonic()
+
     def _log_review_count(self, page_number: int) -> None:
         try:
-            reviews = self.driver.find_elements(By.CSS_SELECTOR, "div[data-hook='review']")
-            if not reviews:
-                reviews = self.driver.find_elements(By.CSS_SELECTOR, "[data-hook='review-body']")
-            if reviews:
-                logger.info("Found %d reviews on page %d.", len(reviews), page_number)
+            count = self.driver.execute_script(_REVIEW_COUNT_JS)
+            if count:
+                logger.info("Found %d reviews on page %d.", count, page_number)
         except Exception as exc:
             logger.debug("Could not count reviews: %s", exc)
 
     def _click_next_page(self, element) -> str | None:
-        """Scroll to *element*, click it, and return the pre-click URL (or *None* on failure)."""
+        """
+        Scroll to *element*, click it, and return the pre-click URL.
+
+        Returns *None* without clicking when the page turned out to be a
+        CAPTCHA / login redirect, and *None* if the click failed.
+        """
         try:
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior:'smooth', block:'center'});",
-                element,
-            )
-            time.sleep(1)
+            next_href, pre_click_url = self.driver.execute_script(_PREPARE_CLICK_JS, element)
         except Exception as exc:
             logger.debug("Could not scroll to button: %s", exc)
+            pre_click_url = self.driver.current_url
+            next_href = element.get_attribute("href")
+
+        # The pre-click URL doubles as the blocked/redirected check
+        if self._is_blocked_or_redirected(pre_click_url):
+            return None
 
+        # Also lets the smooth scroll settle before the click
         random_wait(ACTION_WAIT[0], ACTION_WAIT[1], "before clicking Next")
 
-        pre_click_url = self.driver.current_url
-        next_href = element.get_attribute("href")
         logger.info("Next page href: %s", (next_href or "")[:70])
 
+        self._pace_navigation()
         try:
             self.driver.execute_script("arguments[0].click();", element)
         except Exception:
@@ -300,9 +474,9 @@ class AmazonHTMLScraper:
 
         return pre_click_url
 
-    def _looks_like_last_page(self) -> bool:
-        source = self.driver.page_source.lower()
-        if "there are no customer reviews" in source or "no reviews" in source[:5000]:
+    def _looks_like_last_page(self, source: str) -> bool:
+        """Check the page *source* (and title) for end-of-reviews markers."""
+        if _NO_CUSTOMER_REVIEWS_RE.search(source) or _NO_REVIEWS_RE.search(source, 0, 5000):
             logger.info("'No reviews' message — last page reached.")
             return True
         try:
@@ -313,3 +487,119 @@ class AmazonHTMLScraper:
         except Exception:
             pass
         return False
+
+
+# ----------------------------------------------------------------------
+# Multi-process runs
+# ----------------------------------------------------------------------
+
+def scrape_in_parallel(product_urls: list[str], workers: int = PARALLEL_WORKERS) -> bool:
+    """
+    Scrape *product_urls* with several browsers, one per process.
+
+    Selenium sessions are not thread-safe, so each worker process runs its
+    own :class:`AmazonHTMLScraper` over a round-robin share of the URLs,
+    with its own Chrome profile.  Worker start-ups are staggered by
+    ``PARALLEL_STAGGER`` seconds so Amazon is not hit in lockstep.
+
+    Returns *True* if every worker succeeded.
+    """
+    workers = max(1, min(workers, len(product_urls)))
+    batches = [product_urls[i::workers] for i in range(workers)]
+    if workers > 1:
+        logger.warning(
+            "config/limit.md allows 1 browser instance; running %d in parallel.",
+            workers,
+        )
+
+    # Profiles are copied here, before any Chrome of this run is up, so no
+    # copy is taken while a browser is writing to the main profile.
+    try:
+        profile_dirs = [_worker_profile_dir(i) for i in range(workers)]
+    except OSError as exc:
+        logger.error("Could not prepare worker profiles: %s", exc)
+        return False
+
+    logger.info("Scraping %d products with %d workers …", len(product_urls), workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_scrape_batch, range(workers), profile_dirs, batches))
+
+    return all(results)
+
+
+def _scrape_batch(index: int, profile_dir: Path, product_urls: list[str]) -> bool:
+    """Worker process entry point — scrape *product_urls* in one session."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+    time.sleep(index * PARALLEL_STAGGER)
+
+    scraper = None
+    try:
+        scraper = AmazonHTMLScraper(profile_dir=profile_dir, file_tag=f"_w{index}")
+        if not scraper.start():
+            scraper.stop("Failed to start")
+            return False
+        success = scraper.scrape_many(product_urls)
+        scraper.stop("Completed successfully" if success else "Failed or blocked")
+        return success
+    except Exception as exc:
+        logger.exception("Worker %d failed: %s", index, exc)
+        if scraper:
+            scraper.stop(f"Error: {exc}")
+        return False
+
+
+def _worker_profile_dir(index: int) -> Path:
+    """
+    Profile directory for worker *index*.
+
+    Chrome refuses to share a user-data-dir between processes, so workers
+    after the first get their own copy of the main (logged-in) profile.
+    A copy is reused on later runs until the main profile's cookie store
+    is newer than its own (e.g. after logging in again), then replaced.
+    Copies are built under a ``.tmp`` name and renamed when complete, so
+    an interrupted copy is redone rather than reused.  Raises
+    :class:`OSError` if copying fails.
+    """
+    if index == 0:
+        return PROFILE_DIR
+
+    profile_dir = PROFILE_DIR.with_name(f"{PROFILE_DIR.name}_{index}")
+    if not PROFILE_DIR.exists():
+        return profile_dir
+    if profile_dir.exists():
+        if _cookies_mtime(PROFILE_DIR) <= _cookies_mtime(profile_dir):
+            return profile_dir
+        logger.info("Main profile has newer cookies — refreshing worker %d's copy …", index)
+
+    partial_dir = profile_dir.with_name(f"{profile_dir.name}.tmp")
+    stale_dir = profile_dir.with_name(f"{profile_dir.name}.old")
+    for leftover in (partial_dir, stale_dir):
+        if leftover.exists():
+            logger.info("Removing leftover profile copy %s", leftover)
+            shutil.rmtree(leftover)
+
+    logger.info("Copying browser profile for worker %d …", index)
+    shutil.copytree(
+        PROFILE_DIR, partial_dir,
+        ignore=shutil.ignore_patterns("Singleton*", "lockfile"),
+    )
+
+    # rename() cannot replace a directory on Windows, so move the old copy
+    # aside first
+    if profile_dir.exists():
+        profile_dir.rename(stale_dir)
+    partial_dir.rename(profile_dir)
+    if stale_dir.exists():
+        shutil.rmtree(stale_dir)
+    return profile_dir
+
+
+def _cookies_mtime(profile_dir: Path) -> float:
+    """Modification time of *profile_dir*'s cookie store, 0 if it has none."""
+    for name in _COOKIE_STORES:
+        path = profile_dir / name
+        if path.exists():
+            return path.stat().st_mtime
+    return 0.0
@@ -0,0 +1,154 @@
+"""
+Extraction output must match the original BeautifulSoup pipeline.
+
+Each fixture dump in tests/fixtures/ has a .json next to it holding what
+the BeautifulSoup version of extract_all produced for it. Every read
+path (plain, gzip, truncated gzip, CRLF, mmap, worker pool) has to give
+the same result.
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+import extract.loader
+import extract.run
+from extract.loader import parse_html
+from extract.product import get_about_items
+from extract.run import _latest_html_file, extract_all
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+DUMPS = ["product_and_reviews", "edge_cases", "no_separator"]
+
+
+def expected(name):
+    """Stored baseline result for a fixture dump."""
+    return json.loads((FIXTURES / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def fixture_bytes(name):
+    """Raw bytes of a fixture dump."""
+    return (FIXTURES / f"{name}.html").read_bytes()
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_plain_file(name):
+    assert extract_all(FIXTURES / f"{name}.html") == expected(name)
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_gzip_file(name, tmp_path):
+    path = tmp_path / f"{name}.html.gz"
+    path.write_bytes(gzip.compress(fixture_bytes(name)))
+
+    assert extract_all(path) == expected(name)
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_truncated_gzip_file(name, tmp_path):
+    # scraper killed before close: no gzip trailer, everything else intact
+    data = gzip.compress(fixture_bytes(name))
+    path = tmp_path / f"{name}.html.gz"
+    path.write_bytes(data[:-8])
+
+    assert extract_all(path) == expected(name)
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_crlf_file(name, tmp_path):
+    # dumps written in text mode on Windows
+    path = tmp_path / f"{name}.html"
+    path.write_bytes(fixture_bytes(name).replace(b"\n", b"\r\n"))
+
+    assert extract_all(path) == expected(name)
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_mmap_path(name, monkeypatch):
+    monkeypatch.setattr(extract.loader, "MMAP_THRESHOLD", 0)
+
+    assert extract_all(FIXTURES / f"{name}.html") == expected(name)
+
+
+@pytest.mark.parametrize("name", DUMPS)
+def test_pool_path(name, monkeypatch):
+    monkeypatch.setattr(extract.run, "PARALLEL_MIN_PAGES", 1)
+    monkeypatch.setattr(extract.run, "MAX_IN_FLIGHT", 1)
+
+    assert extract_all(FIXTURES / f"{name}.html") == expected(name)
+
+
+@pytest.mark.parametrize("suffix", [".html", ".html.gz"])
+def test_comment_only_dump(suffix, tmp_path):
+    # a blocked run stops before saving: only the start comment is written
+    data = b"<!-- Amazon HTML Scrape Started: 2026-01-01 10:00:00 -->\n"
+    path = tmp_path / f"blocked{suffix}"
+    path.write_bytes(gzip.compress(data) if suffix.endswith(".gz") else data)
+
+    assert extract_all(path) == {
+        "product_title": None,
+        "price": None,
+        "about_this_item": [],
+        "reviews": [],
+    }
+
+
+def test_about_heading_with_irregular_whitespace():
+    # BeautifulSoup missed this heading; normalize-space now matches it
+    tree = parse_html(
+        "<html><body><h3>About  this\n item</h3>"
+        '<ul class="a-unordered-list a-vertical">'
+        '<li><span class="a-list-item">Soft cotton</span></li></ul>'
+        "</body></html>"
+    )
+
+    assert get_about_items(tree) == ["Soft cotton"]
+
+
+@pytest.mark.parametrize(
+    "names, latest",
+    [
+        (
+            ["amazon_scrape_20260101_090000.html", "amazon_scrape_20260102_090000.html"],
+            "amazon_scrape_20260102_090000.html",
+        ),
+        (
+            ["amazon_scrape_20260101_090000.html", "amazon_scrape_20260102_090000.html.gz"],
+            "amazon_scrape_20260102_090000.html.gz",
+        ),
+        (
+            [
+                "amazon_scrape_20260102_090000.html.gz",
+                "amazon_scrape_20260103_090000_w0.html.gz",
+                "amazon_scrape_20260103_090000_w1.html.gz",
+            ],
+            "amazon_scrape_20260103_090000_w1.html.gz",
+        ),
+        (
+            [
+                "amazon_scrape_20260101_090000.html",
+                "amazon_scrape_20260109_090000.json",
+                "amazon_scrape_20260109_090000.html.gz.part",
+                "zz_notes.html",
+            ],
+            "amazon_scrape_20260101_090000.html",
+        ),
+    ],
+)
+def test_latest_html_file(names, latest, tmp_path, monkeypatch):
+    monkeypatch.setattr(extract.run, "HTML_DIR", tmp_path)
+    for name in names:
+        (tmp_path / name).write_bytes(b"")
+
+    assert _latest_html_file() == tmp_path / latest
+
+
+def test_latest_html_file_without_dumps(tmp_path, monkeypatch):
+    monkeypatch.setattr(extract.run, "HTML_DIR", tmp_path / "missing")
+    assert _latest_html_file() is None
+
+    monkeypatch.setattr(extract.run, "HTML_DIR", tmp_path)
+    (tmp_path / "notes.html").write_bytes(b"")
+    assert _latest_html_file() is None
@@ -0,0 +1,125 @@
+"""
+Scraper-side helpers that run without a browser.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import scraper.worker
+from extract.loader import iter_file_sections
+from extract.run import extract_all
+from scraper.extractor import save_html_to_single_file
+from scraper.worker import AmazonHTMLScraper, _worker_profile_dir
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class FakeDriver:
+    """Just the page state save_html_to_single_file reads."""
+
+    def __init__(self):
+        self.page_source = ""
+        self.current_url = ""
+
+
+@pytest.fixture
+def main_profile(tmp_path, monkeypatch):
+    """A small logged-in-looking main profile, patched in as PROFILE_DIR."""
+    profile = tmp_path / "amazon_home"
+    (profile / "Default" / "Network").mkdir(parents=True)
+    (profile / "Default" / "Network" / "Cookies").write_text("session")
+    (profile / "Local State").write_text("{}")
+    (profile / "SingletonLock").write_text("")
+    (profile / "lockfile").write_text("")
+    monkeypatch.setattr(scraper.worker, "PROFILE_DIR", profile)
+    return profile
+
+
+def _touch(path, mtime):
+    """Set both timestamps of *path* to *mtime*."""
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize("gzip_output", [False, True])
+def test_scraper_dump_round_trips_through_extract(gzip_output, tmp_path, monkeypatch):
+    # write the fixture's pages with the scraper's own writer, then read
+    # the dump back: keeps the separator format and the loader in sync
+    monkeypatch.setattr(scraper.worker, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(scraper.worker, "GZIP_OUTPUT", gzip_output)
+    pages = list(iter_file_sections(FIXTURES / "product_and_reviews.html"))
+
+    scraper_ = AmazonHTMLScraper()
+    scraper_.driver = FakeDriver()
+    scraper_._open_output_file()
+    for page in pages:
+        scraper_.driver.page_source = page["html"]
+        scraper_.driver.current_url = page["url"]
+        save_html_to_single_file(scraper_.driver, scraper_._out_fh, page["label"])
+    scraper_._close_output_file()
+
+    dump = scraper_.output_file
+    assert dump.name.endswith(".html.gz" if gzip_output else ".html")
+    assert [p["label"] for p in iter_file_sections(dump)] == [p["label"] for p in pages]
+    expected = json.loads((FIXTURES / "product_and_reviews.json").read_text(encoding="utf-8"))
+    assert extract_all(dump) == expected
+
+
+def test_first_worker_uses_main_profile(main_profile):
+    assert _worker_profile_dir(0) == main_profile
+    assert sorted(p.name for p in main_profile.parent.iterdir()) == ["amazon_home"]
+
+
+def test_copy_skips_lock_files(main_profile):
+    copy = _worker_profile_dir(1)
+
+    assert copy == main_profile.with_name("amazon_home_1")
+    assert (copy / "Default" / "Network" / "Cookies").read_text() == "session"
+    assert (copy / "Local State").exists()
+    assert not (copy / "SingletonLock").exists()
+    assert not (copy / "lockfile").exists()
+    assert not main_profile.with_name("amazon_home_1.tmp").exists()
+
+
+def test_leftover_partial_copy_is_redone(main_profile):
+    partial = main_profile.with_name("amazon_home_1.tmp")
+    partial.mkdir()
+    (partial / "half-written").write_text("")
+
+    copy = _worker_profile_dir(1)
+
+    assert not partial.exists()
+    assert not (copy / "half-written").exists()
+    assert (copy / "Default" / "Network" / "Cookies").exists()
+
+
+def test_copy_is_reused_while_main_profile_is_not_newer(main_profile):
+    copy = _worker_profile_dir(1)
+    (copy / "worker-state").write_text("kept")
+    _touch(copy / "Default" / "Network" / "Cookies", 2_000_000_000)
+
+    assert _worker_profile_dir(1) == copy
+    assert (copy / "worker-state").read_text() == "kept"
+
+
+def test_copy_is_refreshed_after_new_login(main_profile):
+    copy = _worker_profile_dir(1)
+    (copy / "worker-state").write_text("stale")
+    _touch(copy / "Default" / "Network" / "Cookies", 1_000_000_000)
+
+    (main_profile / "Default" / "Network" / "Cookies").write_text("new session")
+    _touch(main_profile / "Default" / "Network" / "Cookies", 2_000_000_000)
+
+    assert _worker_profile_dir(1) == copy
+    assert (copy / "Default" / "Network" / "Cookies").read_text() == "new session"
+    assert not (copy / "worker-state").exists()
+    assert not main_profile.with_name("amazon_home_1.old").exists()
+
+
+def test_missing_main_profile_copies_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper.worker, "PROFILE_DIR", tmp_path / "amazon_home")
+
+    assert _worker_profile_dir(2) == tmp_path / "amazon_home_2"
+    assert list(tmp_path.iterdir()) == []